@@ -1,10 +1,6 @@
 import PyQt6
 from PyQt6.QtCore import Qt
-import matplotlib
-
-matplotlib.use("Qt5Agg")
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel
 
 
@@ -65,14 +61,22 @@ class Canvas(QFrame):
 
         self.update()
 
-    def show_figure(self, figure):
-
-        """Destroy existing MplCanvas, create new canvas with chosen figure and add to layout."""
+    def show_image(self, png: bytes):
+        """Destroy existing chart, create new label with chosen PNG image scaled to fit the frame and add to layout."""
 
         self.clear_layout()
-        # Set DPI explicitly due to matplotlib scaling bug.
-        figure.dpi = 100
-        self.chart = MplCanvas(fig=figure)
+        pixmap = QPixmap()
+        pixmap.loadFromData(png, "PNG")
+
+        size = self.contentsRect().marginsRemoved(self.layout.contentsMargins()).size()
+        self.chart = QLabel()
+        self.chart.setPixmap(
+            pixmap.scaled(
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        )
         self.layout.addWidget(self.chart)
         self.update()
 
@@ -83,8 +87,3 @@ class Canvas(QFrame):
             widget = item.widget()
             if widget:
                 widget.deleteLater()
-
-
-class MplCanvas(FigureCanvasQTAgg):
-    def __init__(self, fig=Figure()):
-        super(MplCanvas, self).__init__(fig)
@@ -5,11 +5,11 @@ from PyQt6.QtGui import QIcon
 import os
 import sys
 from StormViewer import te
-from shutil import copyfile
 from StormViewer.table import TableView
 from StormViewer.graph import GraphView
 from StormViewer.controls import BottomControls, InputControls, resource_path
 import csv
+from functools import partial
 
 
 class App(QWidget):
@@ -20,9 +20,9 @@ class App(QWidget):
         self.output_directory = None
         self.title = "StormViewer"
 
-        self.threadpool = QThreadPool()
+        self.threadpool = QThreadPool.globalInstance()
+        self.threadpool.setMaxThreadCount(os.cpu_count() or 1)
         self.main_layout = QGridLayout()
-        self.processor = Processor()
         self.top_controls = InputControls()
 
         self.bottom_controls = BottomControls()
@@ -31,6 +31,15 @@ class App(QWidget):
 
         self.iconPath = resource_path("assets/rain-svgrepo-com.svg")
 
+        # Results of background tasks
+        self.po_lines = None
+        self.figs = None
+        self.plotted_figs = []
+        self.plots_remaining = 0
+        self.plots_failed = False
+        # Incremented per plot request, so that results of earlier requests are ignored.
+        self.plot_run = 0
+
         self.initUI()
 
         # Button click connections
@@ -78,21 +87,76 @@ class App(QWidget):
                 )
                 self.top_controls.input_btn.setEnabled(False)
 
-                self.processor = Processor(self.input_directory)
-                self.threadpool.start(self.processor.run)
-
-                self.processor.signals.finished.connect(self.update_table_view)
-                self.processor.signals.error.connect(self.data_failure)
+                task = ParseTask(self.input_directory)
+                task.signals.result.connect(self.load_po_lines)
+                task.signals.finished.connect(self.update_table_view)
+                task.signals.error.connect(self.data_failure)
+                self.threadpool.start(task)
 
         except:
             # Update canvas text to reflect failure.
             pass
 
+    def load_po_lines(self, po_lines):
+        # Clear plots from any previously loaded directory.
+        self.po_lines = po_lines
+        self.figs = None
+        self.plot_run += 1
+
     def create_plots(self):
 
-        self.threadpool.start(self.processor.plot)
-        self.processor.signals.finished.connect(self.update_graph_view)
+        if not self.po_lines:
+            return
+
+        self.figs = None
+        self.plot_run += 1
+        self.plotted_figs = [None] * len(self.po_lines)
+        self.plots_remaining = len(self.po_lines)
+        self.plots_failed = False
+        self.top_controls.create_plots_btn.setEnabled(False)
+
+        # One task per PO line so plots are created concurrently.
+        for i, po_line in enumerate(self.po_lines):
+            task = PlotTask(i, po_line)
+            task.signals.result.connect(partial(self.add_figure, self.plot_run))
+            task.signals.error.connect(partial(self.figure_failure, self.plot_run))
+            self.threadpool.start(task)
+
+    def add_figure(self, plot_run, result):
+        # Ignore plots of a previous request or previously loaded directory.
+        if plot_run != self.plot_run:
+            return
+
+        index, png = result
+        self.plotted_figs[index] = png
+        self.plots_remaining -= 1
+
+        if self.plots_remaining == 0:
+            self.plots_finished()
+
+    def figure_failure(self, plot_run):
+        if plot_run != self.plot_run:
+            return
+
+        self.plots_failed = True
+        self.plots_remaining -= 1
+
+        if self.plots_remaining == 0:
+            self.plots_finished()
+
+    def plots_finished(self):
+        self.top_controls.create_plots_btn.setEnabled(True)
+
+        if self.plots_failed:
+            self.graph_view.chart.update_frame_text(
+                "Could not create plots for all PO lines. Your data may be invalid.",
+                color="red",
+            )
+            return
+
+        self.figs = self.plotted_figs
         self.bottom_controls.save_btn.setEnabled(True)
+        self.update_graph_view()
 
     def update_table_view(self):
         self.top_controls.input_btn.setEnabled(True)
@@ -101,7 +165,7 @@ class App(QWidget):
             'Results loaded: Click "Create Plots" to see plots.', color="green"
         )
         table_data = []
-        storms = self.processor.po_lines
+        storms = self.po_lines
 
         for storm in storms:
             crit_storm = f"{storm.crit_duration}m, {storm.crit_tp}"
@@ -140,81 +204,83 @@ class App(QWidget):
 
     def update_graph_view(self):
 
-        if self.processor.figs is not None:
-            self.graph_view.chart.show_figure(
-                self.processor.figs[self.table_view.selected_row]
-            )
+        if self.figs is not None:
+            self.graph_view.chart.show_image(self.figs[self.table_view.selected_row])
 
     def save_plots(self):
         # Clear output directory
         self.output_directory = None
 
-        if self.processor.figs is not None:
-            self.processor.signals.save_finished.connect(self.plot_success)
-            self.processor.signals.save_error.connect(self.plot_failure)
-
+        if self.figs is not None:
             self.output_directory = QFileDialog.getExistingDirectory(
                 caption="Select Output Directory"
             )
             if self.output_directory:
                 table_data = self.table_view.get_table_output()
                 filename = "StormViewer_results.csv"
-                self.processor.save_plots(self.output_directory, table_data, filename)
+
+                try:
+                    _save_results(
+                        self.po_lines,
+                        self.figs,
+                        self.output_directory,
+                        table_data,
+                        filename,
+                    )
+                    self.plot_success()
+                except:
+                    self.plot_failure()
 
 
 ### Backend Script Connections ###
-class Processor(QRunnable):
-    def __init__(self, input_directory=None):
-        super(Processor).__init__()
+class ParseTask(QRunnable):
+    """Reads PO line results from an input directory. Emits the list of POLine objects as result."""
+
+    def __init__(self, input_directory: str):
+        super().__init__()
         self.input_directory = input_directory
         self.signals = WorkerSignals()
-        self.po_lines = None
-        self.figs = None
 
     def run(self):
         try:
-            self.po_lines = te.read_input_directory(self.input_directory)
-
-            if self.po_lines:
-                self.signals.finished.emit()
+            po_lines = te.read_input_directory(self.input_directory)
         except:
             self.signals.error.emit()
+            return
 
-    def plot(self):
-
-        if not self.po_lines:
-            raise ValueError(
-                "Cannot plot as no POLine objects have been generated yet."
-            )
+        if po_lines:
+            self.signals.result.emit(po_lines)
+            self.signals.finished.emit()
+        else:
+            self.signals.error.emit()
 
-        self.figs = []
 
-        for po_line in self.po_lines:
-            po_line.plot()
-            self.figs.append(po_line.fig)
+class PlotTask(QRunnable):
+    """Plots a single PO line. Emits a tuple of the PO line's row index and its plot as PNG bytes as result."""
 
-        self.signals.finished.emit()
+    def __init__(self, index: int, po_line):
+        super().__init__()
+        self.index = index
+        self.po_line = po_line
+        self.signals = WorkerSignals()
 
-    def save_plots(self, output_dir, tabular_data, filename: str):
-        if self.po_lines:
+    def run(self):
+        try:
+            png = self.po_line.plot()
+        except:
+            self.signals.error.emit()
+            return
 
-            try:
-                for po_line in self.po_lines:
-                    file_name = _str_to_valid_filename(po_line.name) + ".png"
-                    copyfile(
-                        po_line.temp_file.name, os.path.join(output_dir, file_name)
-                    )
-                _list_to_csv(tabular_data, filename, output_dir)
-                self.signals.save_finished.emit()
-            except:
-                print(f"Could not plot {po_line.name}")
-                self.signals.save_error.emit()
+        self.signals.result.emit((self.index, png))
+        self.signals.finished.emit()
 
 
 class WorkerSignals(QObject):
     """
     This class holds signals for QRunnable Object. Supports:
 
+    result
+        Send result object of QRunnable.
     finished
         Send signal that QRunnable has finished execution.
     error
@@ -222,16 +288,18 @@ class WorkerSignals(QObject):
 
     """
 
+    result = QtCore.pyqtSignal(object)
     finished = QtCore.pyqtSignal()
     error = QtCore.pyqtSignal()
 
-    save_finished = QtCore.pyqtSignal()
-    save_error = QtCore.pyqtSignal()
-
 
 # Utils
 
 
+# Translation table replacing troublesome filename chars with a dash.
+_INVALID_FILENAME_CHARS = str.maketrans({c: "-" for c in r"%:/,\[]<>*?"})
+
+
 def _str_to_valid_filename(name: str) -> str:
     """
     Removes troublesome chars from filename. Tries not over-prescribe - keeps underscore and dash chars as this is
@@ -243,16 +311,18 @@ def _str_to_valid_filename(name: str) -> str:
     Returns:
         a string with more valid filename.
     """
-
-    invalid_chars = r"%:/,\[]<>*?"
-    valid_name = ""
-
-    for c in name:
-        if c in invalid_chars:
-            c = "-"
-        valid_name += c
-
-    return valid_name
+    return name.translate(_INVALID_FILENAME_CHARS)
+
+
+def _save_results(
+    po_lines: list, figs: list[bytes], output_dir: str, tabular_data, filename: str
+):
+    # Write plots of all PO lines and tabular results to the output directory.
+    for po_line, png in zip(po_lines, figs):
+        file_name = _str_to_valid_filename(po_line.name) + ".png"
+        with open(os.path.join(output_dir, file_name), "wb") as png_file:
+            png_file.write(png)
+    _list_to_csv(tabular_data, filename, output_dir)
 
 
 def _list_to_csv(data: list[list[str]], filename: str, output_directory: str):
@@ -22,10 +22,8 @@ class Logger:
 
         def _write_df(msg: pandas.DataFrame):
 
-            try:
-                name = str(msg.name) + "\n"
-            except AttributeError:
-                name = ""
+            # Metadata stored in DataFrame attrs, e.g. event and po_line.
+            name = "".join(f"{key}: {value}\n" for key, value in msg.attrs.items())
 
             self.log_string += "\n" + name + msg.to_string() + "\n"
 
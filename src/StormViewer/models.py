@@ -1,7 +1,8 @@
 import pandas as pd
-from matplotlib import pyplot as plt
+from io import BytesIO
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
-from tempfile import NamedTemporaryFile
 
 
 class POLine:
@@ -24,34 +25,36 @@ class POLine:
 
         self.crit_duration, self.crit_tp, self.crit_flow = self.results(data)
 
-        # Figure objects
-        self.fig = None
-        self.temp_file: str
-
-    def plot(self):
+    def plot(self) -> bytes:
+        """
+        Plot max flows of all temporal patterns against duration.
 
-        fig, ax = plt.subplots()
+        Returns:
+            The plot rendered as PNG bytes, to show in gui as well as write to file if user wants to save later.
+        """
+        # Figure is created without pyplot so that PO lines can be plotted concurrently in worker threads.
+        fig = Figure(dpi=200)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
 
-        name = self.data.name
+        name = f"{self.data.attrs['event']}: {self.data.attrs['po_line']}"
 
         tp_cols = [col for col in self.data.columns if "tp" in col]
         T_data = self.data[tp_cols].T
 
-        ax = sns.boxplot(T_data, color="lightyellow", saturation=1.0)
-        ax = sns.stripplot(T_data, palette="dark:black", jitter=0, size=3)
+        sns.boxplot(T_data, color="lightyellow", saturation=1.0, ax=ax)
+        sns.stripplot(T_data, palette="dark:black", jitter=0, size=3, ax=ax)
 
         ax.set_xlabel("Duration (minutes)")
         ax.set_ylabel(r"Max Flow ($\mathregular{m^{3}}$/s)")
         ax.set_title(name)
 
-        # Save figure as object to show in gui, as~ well as file if user wants to save later.
-
-        self.fig = fig
-        self.temp_file = NamedTemporaryFile(suffix=".png", delete=False)
-
-        plt.savefig(self.temp_file.name, dpi=200)
+        # Only keep rendered bytes, releasing figure.
+        png = BytesIO()
+        canvas.print_png(png)
+        fig.clf()
 
-        return
+        return png.getvalue()
 
     def results(self, data):
         """
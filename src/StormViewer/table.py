@@ -1,6 +1,9 @@
+from collections import OrderedDict
 from PyQt6 import QtCore
 from PyQt6.QtGui import QFontMetrics
 from PyQt6.QtWidgets import (
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QWidget,
     QVBoxLayout,
     QLabel,
@@ -10,6 +13,12 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
 )
 
+# Custom role returning all roles needed to paint a cell as a dict, read by SpeedUpDelegate.
+MULTIPLE_ROLES = QtCore.Qt.ItemDataRole.UserRole + 1
+CELL_ALIGNMENT = (
+    QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+)
+
 
 class TableView(QWidget):
     def __init__(self):
@@ -21,6 +30,7 @@ class TableView(QWidget):
         self.dir_str = "Directory: " + self.directory
         self.dir_label = QLabel(self.dir_str)
         self.table = None
+        self.delegate = SpeedUpDelegate()
         self.table_headers = (
             "Location",
             "Event",
@@ -45,7 +55,6 @@ class TableView(QWidget):
         self.setLayout(self.layout)
 
     def init_table(self):
-
         """Initialize critical storm table."""
         table = QTableWidget()
         table.setColumnCount(4)
@@ -62,6 +71,7 @@ class TableView(QWidget):
             table.setColumnWidth(i, width)
 
         table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        table.setItemDelegate(self.delegate)
         table.cellClicked.connect(self.update_selected_row)
         self.table = table
 
@@ -80,15 +90,26 @@ class TableView(QWidget):
 
     def update_table(self):
         """Update table with class storm data. Call after setting self.data."""
+        self.delegate.clear_cache()
         self.table.setRowCount(len(self.data))
 
         for i, row in enumerate(self.data):
             for j, cell in enumerate(row):
-                self.table.setItem(i, j, QTableWidgetItem(str(cell)))
+                text = str(cell)
+                item = QTableWidgetItem(text)
+                item.setData(
+                    MULTIPLE_ROLES,
+                    {
+                        QtCore.Qt.ItemDataRole.DisplayRole: text,
+                        QtCore.Qt.ItemDataRole.TextAlignmentRole: CELL_ALIGNMENT,
+                    },
+                )
+                self.table.setItem(i, j, item)
 
         self.update()
 
     def clear_table_view(self):
+        self.delegate.clear_cache()
         self.table.setRowCount(0)
         self.directory = ""
         self.update_label()
@@ -105,3 +126,52 @@ class TableView(QWidget):
         metrics = QFontMetrics(QFont)
         elided = metrics.elidedText(text, QtCore.Qt.TextElideMode.ElideMiddle, width)
         return elided
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """
+    Item delegate that fetches all roles of a cell in a single data() call via MULTIPLE_ROLES, rather than one call
+    per role, and caches them by (row, column). Call clear_cache() whenever table data changes.
+    """
+
+    def __init__(self, cache_size: int = 1000):
+        super().__init__()
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    def role_data(self, index) -> dict:
+        """Get role data for index, least recently used entries are evicted once cache is full."""
+        key = (index.row(), index.column())
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        data = index.data(MULTIPLE_ROLES) or {}
+        self.cache[key] = data
+
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+        return data
+
+    def initStyleOption(self, option, index):
+        data = self.role_data(index)
+        option.index = index
+
+        text = data.get(QtCore.Qt.ItemDataRole.DisplayRole)
+        if text is not None:
+            option.text = text
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
+        font = data.get(QtCore.Qt.ItemDataRole.FontRole)
+        if font is not None:
+            option.font = font
+            option.fontMetrics = QFontMetrics(font)
+
+        alignment = data.get(QtCore.Qt.ItemDataRole.TextAlignmentRole)
+        if alignment is not None:
+            option.displayAlignment = alignment
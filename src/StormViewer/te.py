@@ -1,34 +1,48 @@
 import csv
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import re
-from matplotlib import pyplot as plt
+import string
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
 from StormViewer import logger
 import traceback
 from StormViewer.models import POLine
-from shutil import rmtree
 
 
-def _header_length(input_csv: str):
-    """Function to get header length"""
-
-    with open(input_csv, "r") as file:
-        reader = csv.reader(file)
-        head = next(reader)
-        return len(head)
+def _scan_header(input_csv: str) -> tuple[int, int, list[str], list[str]]:
+    """
+    Function to scan the top of a PO csv in a single pass. Stops reading after the header row, i.e. the first row
+    containing "Flow", and the row of PO line locations that follows it.
 
+    Args:
+        input_csv: Path to PO file CSV.
 
-def _header_col(input_csv: str):
-    """Function to grab the row number of the header columns in the csv file"""
+    Returns:
+        a 4x1 tuple with the header length, the row number of the header, the header labels and the location labels.
+    """
     with open(input_csv, "r") as file:
         reader = csv.reader(file)
+        head_len = None
+
+        for i, row in enumerate(reader):
+            if i == 0:
+                head_len = len(row)
+            if "Flow" in row:
+                locations = next(reader, [])
+                return head_len, i, row[:head_len], locations[:head_len]
+
+    if head_len is None:
+        raise pd.errors.EmptyDataError(
+            f"No rows to parse in {os.path.basename(input_csv)}"
+        )
 
-        rows = [row for row in reader]
-        header_row = [i for i, row in enumerate(rows) if "Flow" in row]
-
-        return header_row[0]
+    raise ValueError(
+        f"No header row with 'Flow' found in {os.path.basename(input_csv)}"
+    )
 
 
 def get_po_csvs(input_dir: str) -> list:
@@ -42,94 +56,40 @@ def get_po_csvs(input_dir: str) -> list:
         list: List of absolute filepaths (str) of all detected CSVs
 
     """
-    csv_filepaths = []
-
-    for file in os.listdir(input_dir):
-        if "_po.csv" in file.lower():
-            csv_filepaths.append(os.path.join(input_dir, file))
-    return csv_filepaths
-
-
-def _create_local_folder(dir_name: str):
-    """
-    This function creates a working folder in local directory to copy CSV files.
-    """
-
-    if os.path.exists(dir_name):
-        shutil.rmtree(dir_name)
+    with os.scandir(input_dir) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith("_po.csv")
+        ]
 
-    os.mkdir(dir_name)
 
-
-def copy_po_csvs(csv_filepaths: list[str]) -> list[str]:
+def drop_empty_csvs(csv_filepaths: list[str]) -> list[str]:
     """
-    This function copies PO results files to local folder.
+    This function filters out empty PO results files. Files are read in place from the input folder.
     Args:
-        csv_filepaths: A list of CSV files to copy.
+        csv_filepaths: A list of CSV files to filter.
 
     Returns:
-        A list of filepaths of copied CSVs, skipping empty files that were copied.
+        A list of filepaths of non-empty CSVs.
     """
 
-    local_fol = "_local"
-    _create_local_folder(local_fol)
-
     filepaths = []
 
     for path in csv_filepaths:
-        target = os.path.join(local_fol, os.path.basename(path))
-        filepaths.append(target)
-        shutil.copy(path, target)
-
-    # Filter out empty dataframes. This has to be done after copy due to file permissions.
-
-    new_filepaths = []
-
-    for path in filepaths:
-        try:
-            head_len = _header_length(path)
-            df = pd.read_csv(path, usecols=range(0, head_len - 1), header=None)
-            new_filepaths.append(path)
-        except pd.errors.EmptyDataError:
+        # Check file size, no need to open the file to detect empty files.
+        if os.path.getsize(path) == 0:
             print(f"Empty CSV file {os.path.basename(path)}")
+        else:
+            filepaths.append(path)
 
-    return new_filepaths
+    return filepaths
 
 
-def parse_po_csv(input_file: str) -> pd.DataFrame or None:
-    """
-    This function converts PO_line CSVs to pandas dataframes. Does nothing if csv is empty.
-
-    Args:
-        input_file: Path to PO file CSV.
-
-    Returns:
-        Pandas DataFrame with cleaned data from csv. The name of the DataFrame follows the name of the csv file.
-    """
-    try:
-        # Get length of header to drop dummy columns
-        head_len = _header_length(input_file)
-        df = pd.read_csv(input_file, usecols=range(0, head_len), header=None)
-
-        # Set header - first col with "Flow" string
-        head_col = _header_col(input_file)
-        df.columns = df.iloc[head_col]
-        df = df.drop(index=head_col)
-    except pd.errors.EmptyDataError:
-        exit()
-
-    # Drop first column with the filename
-    first_column = df.columns[0]
-    df.drop(first_column, axis=1, inplace=True)
-
-    # Set index as time increment
-    df.set_index(df.columns[0], inplace=True)
-
-    # Label columns with numbers to avoid duplicates
-    df.columns = [f"{column}.{i}" for i, column in enumerate(df.columns)]
-    # Run ID read by input filename prepared by TUFLOW.
-    df.name = os.path.basename(input_file)
-    return df
+# Run ID patterns. Storm will match the string between the first two underscores.
+_RE_STORM = re.compile(r"_([^_]*)_")
+_RE_DURATION = re.compile(r"\d{1,4}m")
+_RE_TEMP_PATT = re.compile(r"tp\d*")
 
 
 def _parse_run_id(run_id: str) -> tuple[str, str, str]:
@@ -146,61 +106,32 @@ def _parse_run_id(run_id: str) -> tuple[str, str, str]:
 
     run_id_l = run_id.lower()
 
-    storm = (
-        re.search(r"_.*?_", run_id_l).group().replace("_", "")
-    )  # Will match the string between the first two underscores.
-    duration = re.search(r"\d{1,4}m", run_id_l).group()
-    temp_patt = re.search(r"tp\d*", run_id_l).group()
+    storm = _RE_STORM.search(run_id_l).group(1)
+    duration = _RE_DURATION.search(run_id_l).group()
+    temp_patt = _RE_TEMP_PATT.search(run_id_l).group()
 
     return storm, duration, temp_patt
 
 
-def _get_po_lines(po_df: pd.DataFrame) -> list[str]:
+def _max_flows_sr(
+    run_id: str, po_lines: list[str], po_max_flows: list[float]
+) -> pd.Series:
     """
-    Grabs names of columns containing max flow, i.e. the po lines. Reads dataframes files generated by parse_po_csv()
+    Builds the pd.Series of max flows for one run, labelled by run ID attributes and PO line.
 
     Args:
-        po_df:
-
-    Returns:
-        A list of column names containing the PO_line names
-    """
-    po_lines = []
-
-    for column, values in po_df.items():
-        if "Flow" in column:
-            location = po_df[column][0]
-            po_lines.append(location)
-    return po_lines
-
-
-def _get_all_max_flows(po_sr: pd.Series) -> pd.Series:
-    """
-    This function processes a cleaned dataframe containing PO line data and returns a pd.Series object with the
-    maximum flow in each PO line for that run.
-
-    Args:
-        po_sr: Pandas DataFrame containing cleaned csv data.
+        run_id: Name of csv file.
+        po_lines: PO line names.
+        po_max_flows: Maximum flow of each PO line.
 
     Returns:
         A pandas series containing the maximum flows for all PO lines in the run. The series .name is equal to the
-        po_df name.
+        run_id.
     """
-    po_lines = _get_po_lines(po_sr)
-
     po_lines_columns = [f"Max Flow {s}" for s in po_lines]
 
     columns = ["Run ID", "Event", "Duration", "Temporal Pattern"] + po_lines_columns
 
-    po_max_flows = []
-
-    for column, values in po_sr.items():
-        if "Flow" in column:
-            # Get max flow in pd Series, ignoring text (typically PO line title)
-            po_max_flows.append((pd.to_numeric(po_sr[column], errors="coerce").max()))
-
-    run_id = po_sr.name
-
     run_id_values = list(_parse_run_id(run_id))
     new_row = [run_id] + run_id_values + po_max_flows
 
@@ -210,174 +141,155 @@ def _get_all_max_flows(po_sr: pd.Series) -> pd.Series:
     return sr
 
 
-def concat_po_srs(max_flows_dfs: list[pd.DataFrame]) -> pd.DataFrame:
+def _read_max_flows(input_file: str, chunksize: int = 500_000) -> pd.Series:
     """
-    This function reads a list of pd.Series containing dataframes with max flows for each run configuration. Only input
-    dataframes generated by parse_po_csv().
+    This function reads a PO_line CSV and returns the maximum flow in each PO line. Only flow columns are read, in
+    chunks of rows, so memory use does not grow with simulation length.
 
     Args:
-        max_flows_dfs: A list containing all dataframes to concatenate (should be output from get_all_max_flows).
+        input_file: Path to PO file CSV.
+        chunksize: Number of rows to read at a time.
 
     Returns:
-        A DataFrame containing all results mimicking legacy spreadsheet.
-
+        A pandas series containing the maximum flows for all PO lines in the run. The series .name is equal to the
+        name of the csv file.
     """
+    head_len, header_row, header, locations = _scan_header(input_file)
 
-    all_runs_df = pd.DataFrame()
+    # Positions of flow columns in file, labelled with numbers to avoid duplicates.
+    flow_positions = [i for i in range(2, head_len) if "Flow" in header[i]]
+    flow_columns = [f"{header[i]}.{i - 2}" for i in flow_positions]
 
-    for df in max_flows_dfs:
-        new_row = _get_all_max_flows(df)
-        all_runs_df = pd.concat([all_runs_df, new_row], axis=1)
-    return all_runs_df.T
+    po_max_flows = np.full(len(flow_positions), np.nan)
 
+    with pd.read_csv(
+        input_file,
+        skiprows=header_row + 2,
+        header=None,
+        names=flow_columns,
+        usecols=flow_positions,
+        dtype="float64",
+        engine="c",
+        chunksize=chunksize,
+    ) as reader:
+        for chunk in reader:
+            # fmax ignores nan, same as DataFrame.max()
+            po_max_flows = np.fmax(po_max_flows, chunk.max().to_numpy())
 
-def _split_po_dfs(df: pd.DataFrame) -> list[pd.DataFrame]:
-    """
-    This function takes all results dataframe with multiple PO lines and splits the dataframes according to each po line
-    for better manipulation.
+    po_lines = [locations[i] for i in flow_positions]
 
-    Args:
-        df: DataFrame containing data for multiple PO lines.
+    return _max_flows_sr(os.path.basename(input_file), po_lines, po_max_flows.tolist())
 
-    Returns:
-        a list containing a DataFrame for each po_line.
 
+def read_max_flows(csv_filepaths: list[str]) -> list[pd.Series]:
     """
+    This function reads the maximum flows of a list of PO_line CSVs concurrently. Reading is I/O bound and the
+    pandas C parser releases the GIL, so files are read in a thread pool.
 
-    po_lines = []
-    po_line_dfs = []
-
-    for column, values in df.items():
-        if "Max Flow" in column:
-            po_lines.append(column)
-
-    for po_line in po_lines:
-        split_df = df
-        excluded_columns = [x for x in po_lines if x != po_line]
-        po_line_dfs.append(split_df.drop(columns=excluded_columns))
+    Args:
+        csv_filepaths: A list of paths to PO file CSVs.
 
-    return po_line_dfs
+    Returns:
+        A list of pd.Series generated by _read_max_flows(), in the same order as csv_filepaths.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_read_max_flows, csv_filepaths))
 
 
-def _split_event(df: pd.DataFrame) -> list[pd.DataFrame]:
+def concat_max_flows(max_flows_srs: list[pd.Series]) -> pd.DataFrame:
     """
-    This function takes a dataframe with multiple events and splits the dataframes according to each event for better
-    manipulation.
+    This function concatenates pd.Series with max flows for each run configuration, as generated by
+    read_max_flows().
 
     Args:
-        df: DataFrame containing data for multiple events
+        max_flows_srs: A list containing max flows of all runs.
 
     Returns:
-        a list containing a DataFrame for each po_line
-    """
+        A DataFrame containing all results mimicking legacy spreadsheet.
 
-    unique_events = df["Event"].unique().tolist()
+    """
+    if not max_flows_srs:
+        return pd.DataFrame()
 
-    event_dfs = []
+    # Concatenate once rather than growing the DataFrame per run. Transposing leaves all columns as object, so restore
+    # float dtype for max flow columns.
+    return pd.concat(max_flows_srs, axis=1).T.infer_objects()
 
-    for event in unique_events:
-        event_dfs.append(df[df["Event"] == event])
 
-    return event_dfs
+# Translation table deleting alphabetical chars.
+_STRIP_ALPHA = str.maketrans("", "", string.ascii_letters)
 
 
-def _drop_sort_duration(df: pd.DataFrame) -> pd.DataFrame:
+def _duration_minutes(durations: pd.Series) -> pd.Series:
     """
-    This function drops all non-numeric chars from the index ('Duration') column in dataframe and sorts the dataframe by
-    numeric value.
+    This function drops all non-numeric chars from a 'Duration' column so that durations sort by numeric value.
 
     Args:
-        df: DataFrame with 'Duration' column.
+        durations: Series of durations, e.g. '10m'.
 
     Returns:
-        a DataFrame sorted by duration (numeric value only).
+        a Series of durations in minutes (numeric value only).
 
     """
-    sorted_df = df
     # Remove alphabetical chars from minutes
-    sorted_df.index = sorted_df.index.map(lambda x: (re.sub(r"[a-zA-Z]", "", str(x))))
-    sorted_df.index = sorted_df.index.map(lambda x: int(x))
-    sorted_df = sorted_df.sort_index()
-    return sorted_df
-
-
-def _get_col_name(value, input_row):
-    """Get column name of value in row generated by df.apply() method."""
-    col_name = input_row[input_row == value].index[0]
-    return col_name
+    return durations.astype(str).str.translate(_STRIP_ALPHA).astype(int)
 
 
-def _get_crit_tp(row: pd.Series) -> str:
+def _get_crit_tps(dur_tp_df: pd.DataFrame) -> np.ndarray:
     """
-    This function is to be applied to processed dataframe of storm durations vs temporal patterns. Used
-    to create a new column with critical storms for each duration. Do not use by itself, used via dataframe apply()
-    method!
+    This function finds the critical storm for each duration of a processed dataframe of storm durations vs temporal
+    patterns, i.e. the temporal pattern with the smallest flow above the median.
 
     Args:
-        row: A pd.Series passed through via df.apply().
+        dur_tp_df: DataFrame with temporal pattern columns and a 'Median' column.
 
     Returns:
-        a string containing name of column with critical storm.
+        an array containing the name of the column with the critical storm for each row.
     """
-    median = row["Median"]
+    tp_cols = np.asarray([col for col in dur_tp_df.columns if "tp" in col])
 
-    diffs = {}
+    diffs = (
+        dur_tp_df[tp_cols].to_numpy(dtype=float)
+        - dur_tp_df["Median"].to_numpy(dtype=float)[:, None]
+    )
 
-    # Skip nan values that occur because of missing results for a particular temporal pattern / duration csv.
-    row = row.dropna()
+    # Ignore storms at or below the median, as well as nan values that occur because of missing results for a
+    # particular temporal pattern / duration csv.
+    diffs[~(diffs > 0)] = np.inf
 
-    for cell in row:
-        col_name = _get_col_name(cell, row)
-        if "tp" in col_name:
-            diffs[col_name] = cell - median
-
-    positive_diffs = {k: v for k, v in diffs.items() if v > 0}
-
-    try:
-        crit_tp = min(positive_diffs, key=positive_diffs.get)
-    except ValueError:
-        # Handle cases where there's no storm above the median value (i.e.all temporal pattern flows == Median).
-        # In this case the function will grab the first storm that matches the median value. In the future a warning
-        # should be raised.
-        crit_tp = "NA"
+    # Handle cases where there's no storm above the median value (i.e.all temporal pattern flows == Median). In the
+    # future a warning should be raised.
+    no_crit_tp = np.isinf(diffs).all(axis=1)
 
-    return crit_tp
+    return np.where(no_crit_tp, "NA", tp_cols[diffs.argmin(axis=1)])
 
 
-def _tp_vs_max_flow_df(df: pd.DataFrame) -> tuple:
+def _tp_vs_max_flow_df(
+    dur_tp_df: pd.DataFrame, event: str, po_line: str
+) -> pd.DataFrame:
     """
-    This function takes a df filtered by one event and one po_line and generates a dataframe presenting storm duration
-    (x) vs temporal patterns (y), as well as average, median and critical temporal patterns for the run. Event and
-    PO_line are stored in the DataFrame name.
-
-    Note that po_line name will be lost in this process!
+    This function takes a dataframe of storm duration (x) vs temporal patterns (y) for one event and one po_line and
+    adds average, median and critical temporal patterns for the run. Event and PO_line are stored in the DataFrame
+    attrs.
 
     Args:
-        df: DataFrame with data for one event and po_line
+        dur_tp_df: DataFrame of max flows for one event and po_line, indexed by duration.
+        event: Storm event of the runs.
+        po_line: Name of the max flow column of the PO line.
 
     Returns:
         A DataFrame sorted by duration (x) vs temporal pattern (y), avg/median values, and critical storm.
     """
-    event = df["Event"].unique().tolist()[0]
-
-    po_line: str = ""
-
-    for column, values in df.items():
-        if "Max Flow" in column:
-            po_line = str(column)
-
-    dur_tp_df = df.pivot(index="Duration", columns="Temporal Pattern", values=po_line)
-    dur_tp_df = _drop_sort_duration(dur_tp_df)
-
     tp_cols = [col for col in dur_tp_df.columns if "tp" in col]
 
     dur_tp_df["Average"] = dur_tp_df[tp_cols].mean(axis=1)
     dur_tp_df["Median"] = dur_tp_df[tp_cols].median(axis=1)
-    dur_tp_df["Critical TP"] = dur_tp_df.apply(_get_crit_tp, axis=1)
+    dur_tp_df["Critical TP"] = _get_crit_tps(dur_tp_df)
 
-    dur_tp_df.name = f"{po_line}: {event} Event"
+    dur_tp_df.attrs["event"] = event
+    dur_tp_df.attrs["po_line"] = po_line
 
-    return event, po_line, dur_tp_df
+    return dur_tp_df
 
 
 def all_critical_storms(all_runs_df: pd.DataFrame) -> list[pd.DataFrame]:
@@ -393,31 +305,35 @@ def all_critical_storms(all_runs_df: pd.DataFrame) -> list[pd.DataFrame]:
         A list of dataframes each with max flow data + average, median and critical storms.
 
     """
-    df = all_runs_df
-
-    events = all_runs_df["Event"].unique()
-    durations = all_runs_df["Duration"].unique()
-    temp_patts = all_runs_df["Temporal Pattern"].unique()
+    po_lines = [column for column in all_runs_df.columns if "Max Flow" in column]
 
-    po_lines_dfs = _split_po_dfs(all_runs_df)
+    # Numeric durations, so that pivots are sorted by duration.
+    all_runs_df = all_runs_df.assign(
+        Duration=_duration_minutes(all_runs_df["Duration"])
+    )
 
-    working_dfs = []
-
-    for _ in po_lines_dfs:
-        final_dfs = _split_event(_)
-        working_dfs.append(final_dfs)
+    # Temporal patterns run for each event, in order of first appearance.
+    event_tps = all_runs_df.groupby("Event", sort=False)["Temporal Pattern"].unique()
 
     all_crit_tp_dfs = []
-    for x in working_dfs:
-        for y in x:
-            event, po_line, df = _tp_vs_max_flow_df(y)
-            sorted_df = _drop_sort_duration(df)
-            sorted_df.name = f"{event}: {po_line}"
-            all_crit_tp_dfs.append(sorted_df)
+    for po_line in po_lines:
+        # Pivot all events at once, then split the pivot by event.
+        po_line_df = all_runs_df.pivot(
+            index=["Event", "Duration"], columns="Temporal Pattern", values=po_line
+        )
+        for event, tps in event_tps.items():
+            # Keep only durations and temporal patterns run for this event.
+            dur_tp_df = po_line_df.loc[event, po_line_df.columns.isin(tps)].copy()
+            all_crit_tp_dfs.append(_tp_vs_max_flow_df(dur_tp_df, event, po_line))
 
     return all_crit_tp_dfs
 
 
+def _crit_storm_name(crit_tp_df: pd.DataFrame) -> str:
+    """Name of critical storms dataframe in format 'storm event: po_line', read from its attrs."""
+    return f"{crit_tp_df.attrs['event']}: {crit_tp_df.attrs['po_line']}"
+
+
 def summarize_results(crit_tp_df: pd.DataFrame):
     """
     This function reads a dataframe listing all critical storms and finds the duration / tp combination with highest
@@ -435,8 +351,8 @@ def summarize_results(crit_tp_df: pd.DataFrame):
 
     crit_tp = crit_tp_df.loc[crit_duration, "Critical TP"]
 
-    event, po_line = str(crit_tp_df.name).split(":", 1)
-    po_line = po_line.replace("Max Flow ", "")
+    event = crit_tp_df.attrs["event"]
+    po_line = crit_tp_df.attrs["po_line"].replace("Max Flow ", "")
 
     if crit_tp == "NA":
         crit_max_flow = "NA"
@@ -449,6 +365,10 @@ def summarize_results(crit_tp_df: pd.DataFrame):
     return pd.Series(data=values, index=index)
 
 
+# Translation table replacing troublesome filename chars with a dash.
+_INVALID_FILENAME_CHARS = str.maketrans({c: "-" for c in r"%:/,\[]<>*?"})
+
+
 def _str_to_valid_filename(name: str) -> str:
     """
     Removes troublesome chars from filename. Tries not over-prescribe - keeps underscore and dash chars as this is
@@ -460,20 +380,11 @@ def _str_to_valid_filename(name: str) -> str:
     Returns:
         a string with more valid filename.
     """
-
-    invalid_chars = r"%:/,\[]<>*?"
-    valid_name = ""
-
-    for c in name:
-        if c in invalid_chars:
-            c = "-"
-        valid_name += c
-
-    return valid_name
+    return name.translate(_INVALID_FILENAME_CHARS)
 
 
 def plot_results(
-    crit_storm_df: pd.DataFrame, output_path: str, strip_plot=True
+    crit_storm_df: pd.DataFrame, output_path: str, strip_plot=True, fig: Figure = None
 ) -> None:
     """
     Plotting function for critical storms dataframe. Plots to PNG file with filename in format 'storm event- po_line'.
@@ -483,27 +394,29 @@ def plot_results(
         crit_storm_df: tp vs duration results to plot.
         output_path: Folder to generate all results.
         strip_plot: Whether to show individual temporal patterns as points overlaid on each box. Defaults to True.
+        fig: Figure to draw on, cleared after saving. Pass the same figure when plotting many results to avoid
+            creating a new figure per plot. Defaults to a new figure.
     Returns:
         No return value, outputs plots as files directly into output_path.
 
     """
 
-    # Only plot tp columns, ignoring meta-stats column (e.g. Median).
-
-    fig, ax = plt.subplots()
+    # Draw on Agg canvas directly, bypassing pyplot state machine.
+    if fig is None:
+        fig = Figure(figsize=(6.4, 4.8), dpi=200)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
-    name = crit_storm_df.name
+    name = _crit_storm_name(crit_storm_df)
 
+    # Only plot tp columns, ignoring meta-stats column (e.g. Median).
     tp_cols = [col for col in crit_storm_df.columns if "tp" in col]
 
-    for col in tp_cols:
-        crit_storm_df[col] = crit_storm_df[col].astype(float)
-
-    data = crit_storm_df[tp_cols].T
-    ax = sns.boxplot(data, color="lightyellow", saturation=1.0)
+    data = crit_storm_df[tp_cols].astype(float).T
+    sns.boxplot(data, color="lightyellow", saturation=1.0, ax=ax)
 
     if strip_plot:
-        ax = sns.stripplot(data, palette="dark:black", jitter=0, size=3)
+        sns.stripplot(data, palette="dark:black", jitter=0, size=3, ax=ax)
 
     ax.set_xlabel("Duration (m)")
     ax.set_ylabel("Max Flow (cu.m/sec)")
@@ -513,9 +426,9 @@ def plot_results(
     filepath = os.path.join(output_path, filename)
 
     # Save as png in local directory
-    plt.savefig(filepath + ".png", dpi=200)
+    canvas.print_png(filepath + ".png")
 
-    plt.close()
+    fig.clf()
 
 
 def _skipped_inputs(raw_inputs: list, saved_inputs: list) -> list:
@@ -535,25 +448,21 @@ def read_input_directory(input_path: str):
     log_file = logger.Logger()
     results_file = logger.Logger()
 
-    # Read input folder and download/copy files
+    # Read input folder and skip empty files
     raw_inputs = get_po_csvs(input_path)
-    saved_inputs = copy_po_csvs(raw_inputs)
+    saved_inputs = drop_empty_csvs(raw_inputs)
 
     # Log events
 
-    log_file.log(f"Inputs copied to local folder from source folder {input_path}:")
+    log_file.log(f"Inputs read from source folder {input_path}:")
     log_file.log([os.path.basename(saved_input) for saved_input in saved_inputs])
     log_file.log("\nSkipped inputs:")
     log_file.log(_skipped_inputs(raw_inputs, saved_inputs))
 
     # Get max flows
-    all_max_flows = []
-
-    for csv in saved_inputs:
-        df1 = parse_po_csv(csv)
-        all_max_flows.append(df1)
+    all_max_flows = read_max_flows(saved_inputs)
 
-    df1 = concat_po_srs(all_max_flows)
+    df1 = concat_max_flows(all_max_flows)
 
     # Log resulting maximum flows for all PO Lines
 
@@ -568,20 +477,14 @@ def read_input_directory(input_path: str):
     for df in all_crit:
         # Get PO Line location name
         try:
-            name = df.name
-            valid_name = _str_to_valid_filename(name)
-            name_split = name.split(":")
-            loc = name_split[1].replace("Max Flow", "").strip()
-            event = name_split[0]
+            valid_name = _str_to_valid_filename(_crit_storm_name(df))
+            loc = df.attrs["po_line"].replace("Max Flow", "").strip()
+            event = df.attrs["event"]
             po_line = POLine(name=valid_name, loc=loc, event=event, data=df)
             po_lines.append(po_line)
         except:
-            print(f"Failed to create POLine object for {df.name}")
+            print(f"Failed to create POLine object for {df.attrs}")
 
-    try:
-        rmtree("_local")
-    except:
-        print("Could not delete local folder")
     return po_lines
 
 
@@ -592,24 +495,20 @@ def main(input_path: str, output_path: str):
     results_file = logger.Logger()
 
     try:
-        # Read input folder and download/copy files
+        # Read input folder and skip empty files
         raw_inputs = get_po_csvs(input_path)
-        saved_inputs = copy_po_csvs(raw_inputs)
+        saved_inputs = drop_empty_csvs(raw_inputs)
 
         # Log events
-        log_file.log(f"Inputs copied to local folder from source folder {input_path}:")
+        log_file.log(f"Inputs read from source folder {input_path}:")
         log_file.log([os.path.basename(saved_input) for saved_input in saved_inputs])
         log_file.log("\nSkipped inputs:")
         log_file.log(_skipped_inputs(raw_inputs, saved_inputs))
 
         # Get max flows
-        all_max_flows = []
-
-        for csv in saved_inputs:
-            df1 = parse_po_csv(csv)
-            all_max_flows.append(df1)
+        all_max_flows = read_max_flows(saved_inputs)
 
-        df1 = concat_po_srs(all_max_flows)
+        df1 = concat_max_flows(all_max_flows)
 
         # Log resulting maximum flows for all PO Lines
 
@@ -624,22 +523,20 @@ def main(input_path: str, output_path: str):
 
         for df in all_crit:
             # Get PO Line location name
-            name = _str_to_valid_filename(df.name)
+            name = _str_to_valid_filename(_crit_storm_name(df))
             print(name)
-            name_list = df.name.split(":")
-            loc = name_list[1].replace("Max Flow", "").strip()
-            event = name_list[0]
+            loc = df.attrs["po_line"].replace("Max Flow", "").strip()
+            event = df.attrs["event"]
             po_line = POLine(name=name, loc=loc, event=event, data=df)
             po_lines.append(po_line)
 
-        fig = po_lines[0].plot()
-        plt.show()
         # Log critical storms
         log_file.log(all_crit)
 
-        # Plot
+        # Plot, reusing one figure for all results
+        fig = Figure(figsize=(6.4, 4.8), dpi=200)
         for df in all_crit:
-            plot_results(df, output_path)
+            plot_results(df, output_path, fig=fig)
 
         # Generate Results
         results_sr = []
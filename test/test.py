@@ -10,14 +10,35 @@ wd = pathlib.Path(__file__).parent.resolve()
 sample_data = os.path.join(wd, "sample_data")
 
 
-class TestParsePoCSV(unittest.TestCase):
-    # This test checks that result csv file is being parsed as a dataframe
-    # correctly.
-    def test_parse_po_csv(self):
-        expected_output = pd.read_pickle(os.path.join(wd, "df_parse_po_csv.pickle"))
-        input_csv = os.path.join(sample_data, "Example_010.0Y_10m_tp01_001_PO.csv")
-        actual_output = te.parse_po_csv(input_csv)
-        pd.testing.assert_frame_equal(expected_output, actual_output)
+class TestReadMaxFlows(unittest.TestCase):
+    # This test checks that max flows streamed from csv files match the max
+    # flows in the sample csv files.
+    def test_read_max_flows(self):
+        run_ids = [
+            "Example_010.0Y_10m_tp01_001_PO.csv",
+            "Example_100.0Y_270m_tp10_001_PO.csv",
+        ]
+        expected = pd.DataFrame(
+            [
+                [run_ids[0], "010.0y", "10m", "tp01", 1.6374],
+                [run_ids[1], "100.0y", "270m", "tp10", 4.1848],
+            ],
+            index=run_ids,
+            columns=[
+                "Run ID",
+                "Event",
+                "Duration",
+                "Temporal Pattern",
+                "Max Flow Location1",
+            ],
+        )
+        actual = te.concat_max_flows(
+            [
+                te._read_max_flows(os.path.join(sample_data, run_id), chunksize=10)
+                for run_id in run_ids
+            ]
+        )
+        pd.testing.assert_frame_equal(expected, actual)
 
 
 class TestParseStormName(unittest.TestCase):
@@ -47,11 +68,84 @@ class TestCritStorm(unittest.TestCase):
             "tp02",
             "tp03",
         ]
-        df["Critical Storm"] = df.apply(te._get_crit_tp, axis=1)
+        df["Critical Storm"] = te._get_crit_tps(df)
         actual = df["Critical Storm"].tolist()
         self.assertEqual(expected, actual)
 
 
+class TestAllCriticalStorms(unittest.TestCase):
+    # This test checks that critical storm dataframes are generated for each PO
+    # line and event, where events have different durations and temporal patterns.
+    def test_all_critical_storms(self):
+        flows = {
+            # Event: {Duration: {Temporal Pattern: (Max Flow A, Max Flow B)}}
+            "1%aep": {
+                "120m": {"tp01": (7, 2), "tp02": (9, 1), "tp03": (8, 3)},
+                "10m": {"tp01": (1, 3), "tp02": (2, 3), "tp03": (3, 3)},
+                "60m": {"tp01": (6, 1), "tp02": (4, 3), "tp03": (5, 2)},
+            },
+            "5%aep": {
+                "90m": {"tp01": (4, 1), "tp02": (3, 2), "tp03": (2, 3)},
+                "30m": {
+                    "tp01": (1, 4),
+                    "tp02": (2, 3),
+                    "tp03": (3, 2),
+                    "tp04": (4, 1),
+                },
+            },
+        }
+        rows = [
+            [f"{event}_{duration}_{tp}", event, duration, tp, a, b]
+            for event, durations in flows.items()
+            for duration, tps in durations.items()
+            for tp, (a, b) in tps.items()
+        ]
+        all_runs_df = pd.DataFrame(
+            rows,
+            columns=[
+                "Run ID",
+                "Event",
+                "Duration",
+                "Temporal Pattern",
+                "Max Flow A",
+                "Max Flow B",
+            ],
+        )
+
+        actual = te.all_critical_storms(all_runs_df)
+
+        # PO lines outer, events inner.
+        expected_attrs = [
+            {"event": "1%aep", "po_line": "Max Flow A"},
+            {"event": "5%aep", "po_line": "Max Flow A"},
+            {"event": "1%aep", "po_line": "Max Flow B"},
+            {"event": "5%aep", "po_line": "Max Flow B"},
+        ]
+        expected_durations = [[10, 60, 120], [30, 90], [10, 60, 120], [30, 90]]
+        expected_tp_cols = [
+            ["tp01", "tp02", "tp03"],
+            ["tp01", "tp02", "tp03", "tp04"],
+            ["tp01", "tp02", "tp03"],
+            ["tp01", "tp02", "tp03", "tp04"],
+        ]
+        expected_crit_tps = [
+            ["tp03", "tp01", "tp02"],
+            ["tp03", "tp01"],
+            ["NA", "tp02", "tp03"],
+            ["tp02", "tp03"],
+        ]
+
+        self.assertEqual(len(expected_attrs), len(actual))
+        for i, df in enumerate(actual):
+            self.assertEqual(expected_attrs[i], df.attrs)
+            self.assertEqual(expected_durations[i], df.index.tolist())
+            self.assertEqual(
+                expected_tp_cols[i] + ["Average", "Median", "Critical TP"],
+                df.columns.tolist(),
+            )
+            self.assertEqual(expected_crit_tps[i], df["Critical TP"].tolist())
+
+
 class TestLogging(unittest.TestCase):
     """This class tests logging functionality."""
 